@@ -1,12 +1,23 @@
 import logging
 import asyncio
+import gc
+import sys
+import time
+import uuid
+from functools import partial
+import numpy as np
+import orjson
 from aiogram import Bot, Dispatcher, types
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import PRODUCTION
 from aiogram.filters import Command
-from pybit.unified_trading import WebSocket, WebSocketTrading
+from picows import WSAutoPingStrategy, WSFrame, WSListener, WSMsgType, WSTransport, ws_connect
+from pybit.unified_trading import WebSocketTrading
 from environs import Env
+from orderbook import OrderBookSide
 
 # Logging configuration
-logging.basicConfig(format=("|%(asctime)s| %(levelname)s |%(message)s"), level=logging.DEBUG)
+logging.basicConfig(format=("|%(asctime)s| %(levelname)s |%(message)s"), level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Loading environment variables
@@ -20,77 +31,429 @@ TELEGRAM_CHAT_ID = env.str("TELEGRAM_CHAT_ID")
 SYMBOL = env.str("SYMBOL")
 TARGET_PROFIT_PERCENT = env.float("TARGET_PROFIT_PERCENT")
 AMOUNT = env.float("AMOUNT")
-
-# Initialize Telegram bot
-bot = Bot(token=TELEGRAM_TOKEN)
+TARGET_PROFIT_MULT = 1.0 + TARGET_PROFIT_PERCENT / 100.0
+# How long shutdown waits for a sell order that is already in flight
+POSITION_CLOSE_DRAIN_TIMEOUT = 15
+
+# Initialize Telegram bot with one explicitly configured HTTP session, so connections
+# to the Bot API are pooled and kept alive between notifications
+session = AiohttpSession(
+    api=PRODUCTION,
+    limit=10,
+    json_loads=orjson.loads,
+    json_dumps=lambda obj: orjson.dumps(obj).decode(),
+)
+session._connector_init["keepalive_timeout"] = 60
+bot = Bot(token=TELEGRAM_TOKEN, session=session)
 dp = Dispatcher()
 
-# Initialize Bybit WebSocket for private and public channels
-ws_public = WebSocket(testnet=True, channel_type="spot")
-ws_private = WebSocketTrading(testnet=True, api_key=BYBIT_API_KEY, api_secret=BYBIT_API_SECRET)
+# Outgoing Telegram notifications are queued and sent in batches by notification_flusher
+NOTIFICATION_FLUSH_INTERVAL = 0.2
+NOTIFICATION_DRAIN_TIMEOUT = 5
+NOTIFICATION_SEPARATOR = "\n\n"
+TELEGRAM_MESSAGE_LIMIT = 4096
+notification_queue: asyncio.Queue[str] = asyncio.Queue(maxsize=1000)
+
+
+class OrderTemplate:
+    __slots__ = ("buffer", "request_id_offset", "timestamp_offset")
+
+    # Fixed width placeholders, str(uuid.uuid4()) is always 36 characters and a millisecond timestamp 13 digits
+    REQUEST_ID_PLACEHOLDER = "0" * 36
+    TIMESTAMP_PLACEHOLDER = 1_000_000_000_000
+
+    def __init__(self, message: dict):
+        """Serializes an order operation message once, leaving slots for the per-request fields.
+
+        Args:
+            message (dict): Complete order operation message with placeholder reqId and timestamp.
+        """
+        self.buffer = bytearray(orjson.dumps(message))
+        self.request_id_offset = self.buffer.index(orjson.dumps(self.REQUEST_ID_PLACEHOLDER)) + 1
+        self.timestamp_offset = self.buffer.index(b'"X-BAPI-TIMESTAMP":') + len(b'"X-BAPI-TIMESTAMP":')
+
+    def render(self, request_id: str, timestamp: int) -> bytes:
+        """Fills in the per-request fields.
+
+        Args:
+            request_id (str): UUID of the request, 36 characters.
+            timestamp (int): Request time in milliseconds, 13 digits.
+
+        Returns:
+            bytes: Ready to send JSON message.
+        """
+        buffer = self.buffer
+        buffer[self.request_id_offset:self.request_id_offset + 36] = request_id.encode()
+        buffer[self.timestamp_offset:self.timestamp_offset + 13] = str(timestamp).encode()
+        return bytes(buffer)
+
+
+class TemplateWebSocketTrading(WebSocketTrading):
+    """pybit trading WebSocket that can send order requests from pre-serialized templates.
+
+    Builds the same message as pybit's _send_order_operation, but encodes it only once.
+    """
+
+    def build_order_template(self, operation: str, request: dict) -> OrderTemplate:
+        """Pre-serializes an order operation.
+
+        Args:
+            operation (str): Operation name, e.g. "order.create".
+            request (dict): Order request parameters.
+
+        Returns:
+            OrderTemplate: Template to pass to send_order_template.
+        """
+        header = {"X-BAPI-TIMESTAMP": OrderTemplate.TIMESTAMP_PLACEHOLDER}
+        if self.recv_window:
+            header["X-BAPI-RECV-WINDOW"] = self.recv_window
+        if self.referral_id:
+            header["Referer"] = self.referral_id
+        return OrderTemplate({
+            "reqId": OrderTemplate.REQUEST_ID_PLACEHOLDER,
+            "header": header,
+            "op": operation,
+            "args": [request],
+        })
+
+    def send_order_template(self, template: OrderTemplate, callback) -> None:
+        """Sends an order request built from a template.
+
+        Args:
+            template (OrderTemplate): Pre-serialized order operation.
+            callback (callable): Called by pybit with the response message.
+        """
+        request_id = str(uuid.uuid4())
+        message = template.render(request_id, int(time.time() * 1000))
+        # Register the callback first, so even an immediate response finds it
+        self._set_callback(request_id, callback)
+        self.ws.send(message)
+
+
+# Initialize Bybit WebSocket for the private channel
+ws_private = TemplateWebSocketTrading(testnet=True, api_key=BYBIT_API_KEY, api_secret=BYBIT_API_SECRET)
+
+# Bybit public order book stream
+BYBIT_PUBLIC_WS_URL = "wss://stream-testnet.bybit.com/v5/public/spot"
+ORDERBOOK_DEPTH = 50
+ORDERBOOK_PING_INTERVAL = 20
+ORDERBOOK_PING_TIMEOUT = 10
+ORDERBOOK_RECONNECT_DELAY = 5
+ORDERBOOK_WARMUP_TIMEOUT = 2
+BYBIT_PING_MESSAGE = orjson.dumps({"op": "ping"})
+
+
+class OrderbookListener(WSListener):
+    def __init__(self, trading_bot: "TradingBot"):
+        """Initializes the listener that feeds public order book frames into the trading bot.
+
+        picows calls the listener on the event loop as frames are read from the socket, there is
+        no reader thread or intermediate queue between the socket and handle_orderbook.
+        """
+        super().__init__()
+        self.trading_bot = trading_bot
+        # Bound once instead of resolving the trading bot methods on every frame
+        self.on_orderbook = trading_bot.handle_orderbook
+        self.publish_orderbook = trading_bot.publish_orderbook
+        self.call_soon = asyncio.get_running_loop().call_soon
+        # Set when a frame changed the local book and the publish is not done yet
+        self.book_changed = False
+
+    def on_ws_connected(self, transport: WSTransport) -> None:
+        """Subscribes to the order book topic as soon as the connection is ready."""
+        subscribe_message = {"op": "subscribe", "args": [f"orderbook.{ORDERBOOK_DEPTH}.{SYMBOL}"]}
+        transport.send(WSMsgType.TEXT, orjson.dumps(subscribe_message))
+
+    def send_user_specific_ping(self, transport: WSTransport) -> None:
+        """Sends the Bybit application level ping instead of a WebSocket PING frame."""
+        transport.send(WSMsgType.TEXT, BYBIT_PING_MESSAGE)
+
+    def on_ws_frame(self, transport: WSTransport, frame: WSFrame) -> None:
+        """Parses a raw frame and dispatches order book updates to the trading bot.
+
+        Args:
+            transport (WSTransport): Transport of the public WebSocket connection.
+            frame (WSFrame): Received frame, only valid for the duration of this call.
+        """
+        msg_type = frame.msg_type
+        if msg_type is WSMsgType.TEXT:
+            message = orjson.loads(frame.get_payload_as_memoryview())
+            if "topic" in message:
+                # Latest tick wins: publish once, after all frames already read from the socket are applied
+                if self.on_orderbook(message) and not self.book_changed:
+                    self.book_changed = True
+                    self.call_soon(self._flush)
+            elif message.get("op") == "ping":
+                transport.notify_user_specific_pong_received()
+            elif message.get("op") == "subscribe" and not message.get("success"):
+                logger.error("Order book subscription rejected: %s", message)
+        elif msg_type is WSMsgType.CLOSE:
+            transport.send_close(frame.get_close_code(), frame.get_close_message())
+            transport.disconnect()
+
+    def _flush(self) -> None:
+        """Publishes the local book once the frames of the current socket read are applied.
+
+        Scheduled with call_soon instead of waiting for the last frame of the read, picows handles
+        control frames itself, so the last frame may never reach on_ws_frame.
+        """
+        self.book_changed = False
+        self.publish_orderbook()
+
+    def on_ws_disconnected(self, transport: WSTransport) -> None:
+        """Notifies the trading bot that the order book stream was lost."""
+        self.trading_bot.handle_orderbook_disconnect()
 
 
 class TradingBot:
-    def __init__(self, websocket_private: WebSocketTrading, websocket_public: WebSocket):
-        """Initializes the TradingBot instance with private and public WebSocket connections."""
+    # Fixed attribute layout, the order book callback reads several of these on every tick
+    __slots__ = (
+        "active_position",
+        "ws_private",
+        "ws_public",
+        "_loop",
+        "_task_group",
+        "_book",
+        "_first_book",
+        "_target_hit",
+        "_monitor_task",
+        "_close_task",
+        "_resubscribe_task",
+        "bids",
+        "asks",
+        "is_subscribed",
+        "_stopping",
+        "_buy_order",
+        "_sell_order",
+    )
+
+    def __init__(self, websocket_private: TemplateWebSocketTrading):
+        """Initializes the TradingBot instance with the private WebSocket connection.
+
+        The public order book stream is opened by start, before the first trade is requested.
+        """
         self.active_position = None
         self.ws_private = websocket_private
-        self.ws_public = websocket_public
-        self.orderbook_data = {"bid": None, "ask": None}
-        self.orderbook_event = asyncio.Event()
+        self.ws_public: WSTransport | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task_group: asyncio.TaskGroup | None = None
+        # Preallocated [bid, ask] buffer overwritten in place on every tick, zeros until the first update
+        self._book = np.zeros(2, dtype=np.float64)
+        # Resolved by the first order book update after the stream is (re)opened
+        self._first_book: asyncio.Future | None = None
+        self._target_hit: asyncio.Future | None = None
+        # Background tasks of the bot, kept so shutdown can finish or cancel them
+        self._monitor_task: asyncio.Task | None = None
+        self._close_task: asyncio.Task | None = None
+        self._resubscribe_task: asyncio.Task | None = None
+        # Local copy of the order book, built from the snapshot and kept current with deltas
+        self.bids = OrderBookSide(ORDERBOOK_DEPTH, descending=True)
+        self.asks = OrderBookSide(ORDERBOOK_DEPTH, descending=False)
         self.is_subscribed = False
-        self.order_response_event = asyncio.Event()
-        self.order_response = None
-
-    def handle_orderbook(self, message: dict) -> None:
+        # Set by stop, a stream closed on shutdown must not be reopened
+        self._stopping = False
+        # Order requests never change shape, serialize them once
+        buy_payload = {
+            "category": "spot",
+            "symbol": SYMBOL,
+            "side": "Buy",
+            "orderType": "MARKET",
+            "qty": str(AMOUNT),
+            "marketUnit": "baseCoin",
+        }
+        sell_payload = {**buy_payload, "side": "Sell"}
+        self._buy_order = websocket_private.build_order_template("order.create", buy_payload)
+        self._sell_order = websocket_private.build_order_template("order.create", sell_payload)
+
+    def handle_orderbook(self, message: dict) -> bool:
         """Processes the order book data received from WebSocket.
 
+        Bybit sends a full snapshot after subscribing and only changed levels afterwards,
+        so deltas are applied to the local book instead of being treated as a new book.
+        Every frame has to be applied, the resulting top of book is published by publish_orderbook.
+
         Args:
             message (dict): Message containing order book data.
+
+        Returns:
+            bool: True if the frame was applied to the local book, False otherwise.
+        """
+        try:
+            data = message["data"]
+            if message["type"] == "snapshot":
+                self.bids.load(data["b"])
+                self.asks.load(data["a"])
+            else:
+                self.bids.apply(data["b"])
+                self.asks.apply(data["a"])
+        except Exception as e:
+            logger.error("Error in handle_orderbook: %s", e)
+            return False
+        return True
+
+    def publish_orderbook(self) -> None:
+        """Publishes the top of the local book to readers and wakes up whoever waits for a price.
+
+        Called once per socket read, after its frames are applied. A backlog of ticks read at once
+        is acted on as a single update with the newest prices, stale intermediate prices are never
+        published.
         """
         try:
-            orderbook_data = message.get("data", {})
-            if not orderbook_data.get('b') or not orderbook_data.get('a'):
+            bids = self.bids
+            asks = self.asks
+            if not bids.count or not asks.count:
                 logger.warning("Incomplete orderbook data received")
                 return
 
-            bid = float(orderbook_data['b'][0][0])
-            ask = float(orderbook_data['a'][0][0])
-
-            self.orderbook_data = {"bid": bid, "ask": ask}
-            self.orderbook_event.set()
-            logger.debug(f"Orderbook data received: {self.orderbook_data}")
+            bid = float(bids.best)
+            ask = float(asks.best)
+            # Both prices are written on the event loop thread, readers never see a half-updated book
+            book = self._book
+            book[0] = bid
+            book[1] = ask
+            logger.debug("Orderbook data received: bid=%s ask=%s", bid, ask)
+
+            first_book = self._first_book
+            if not first_book.done():
+                first_book.set_result(None)
+
+            # Wake up monitor_position on the tick that reaches the target price
+            position = self.active_position
+            if position and bid >= position['target_price']:
+                target_hit = self._target_hit
+                if not target_hit.done():
+                    target_hit.set_result(bid)
         except Exception as e:
-            logger.error(f"Error in handle_orderbook: {e}")
+            logger.error("Error in publish_orderbook: %s", e)
+
+    def handle_orderbook_disconnect(self) -> None:
+        """Marks the order book stream as lost and schedules a reconnect.
+
+        The local book is dropped, so no trade is opened on prices that are no longer streamed.
+        """
+        self.ws_public = None
+        self.is_subscribed = False
+        self._book[:] = 0.0
+        self.bids.clear()
+        self.asks.clear()
+        if self._first_book.done():
+            self._first_book = self._loop.create_future()
+        if self._stopping:
+            logger.info("Order book stream closed")
+            return
+        logger.warning("Order book stream disconnected")
+        self._resubscribe_task = self._task_group.create_task(self.resubscribe_to_orderbook())
 
-    def handle_order_response(self, message: dict) -> None:
+    def handle_order_response(self, response: asyncio.Future, message: dict) -> None:
         """Handles the response to an order request.
 
+        pybit calls this from its WebSocket thread, so the response is handed over to the event loop.
+
+        Args:
+            response (asyncio.Future): Future of the order request this message answers.
+            message (dict): Message containing order response data.
+        """
+        self._loop.call_soon_threadsafe(self._on_order_response, response, message)
+
+    @staticmethod
+    def _on_order_response(response: asyncio.Future, message: dict) -> None:
+        """Resolves the order request future on the event loop.
+
         Args:
+            response (asyncio.Future): Future of the order request this message answers.
             message (dict): Message containing order response data.
         """
-        self.order_response = message
-        self.order_response_event.set()
+        if not response.done():
+            response.set_result(message)
+
+    def _place_order(self, template: OrderTemplate) -> asyncio.Future:
+        """Sends an order request over the private WebSocket.
+
+        Args:
+            template (OrderTemplate): Pre-serialized order request.
+
+        Returns:
+            asyncio.Future: Resolved with the order response, a late response of a timed out
+            request can never be mistaken for the response of the next one.
+        """
+        response = self._loop.create_future()
+        self.ws_private.send_order_template(template, partial(self.handle_order_response, response))
+        return response
+
+    async def start(self, task_group: asyncio.TaskGroup) -> None:
+        """Binds the trading bot to the running event loop and opens the order book stream.
+
+        Must be awaited before trading. Subscribing here keeps the book warm, so the first
+        trade does not pay for the subscription.
+
+        Args:
+            task_group (asyncio.TaskGroup): Group that owns the bot's background tasks.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._task_group = task_group
+        self._first_book = self._loop.create_future()
+
+        try:
+            await self.subscribe_to_orderbook()
+        except Exception:
+            self._resubscribe_task = task_group.create_task(self.resubscribe_to_orderbook())
+            return
+
+        if not await self._wait_first_book():
+            logger.warning("No orderbook data received yet")
 
     async def subscribe_to_orderbook(self) -> None:
         """Subscribes to the order book for market data updates."""
         if not self.is_subscribed:
             try:
                 logger.info("Subscribing to orderbook...")
-                self.ws_public.orderbook_stream(50, SYMBOL, self.handle_orderbook)
+                self.ws_public, _ = await ws_connect(
+                    lambda: OrderbookListener(self),
+                    BYBIT_PUBLIC_WS_URL,
+                    enable_auto_ping=True,
+                    auto_ping_idle_timeout=ORDERBOOK_PING_INTERVAL,
+                    auto_ping_reply_timeout=ORDERBOOK_PING_TIMEOUT,
+                    auto_ping_strategy=WSAutoPingStrategy.PING_PERIODICALLY,
+                )
                 self.is_subscribed = True
-                logger.info(f"Subscribed to order book for {SYMBOL}")
+                logger.info("Subscribed to order book for %s", SYMBOL)
             except Exception as e:
-                logger.error(f"Error subscribing to order book: {e}")
+                logger.error("Error subscribing to order book: %s", e)
                 raise
 
-    async def get_order_book(self) -> dict[str, None]:
+    async def resubscribe_to_orderbook(self) -> None:
+        """Reopens the order book stream after a disconnect, retrying until it succeeds."""
+        while not self.is_subscribed:
+            await asyncio.sleep(ORDERBOOK_RECONNECT_DELAY)
+            try:
+                await self.subscribe_to_orderbook()
+            except Exception:
+                continue
+
+    async def get_order_book(self) -> np.ndarray:
         """Retrieves the current order book data.
 
         Returns:
-            dict: Contains bid and ask prices.
+            np.ndarray: Live [bid, ask] buffer updated in place, zeros until the first update arrives.
+        """
+        return self._book
+
+    async def _wait_first_book(self, timeout: float = ORDERBOOK_WARMUP_TIMEOUT) -> bool:
+        """Waits until the first order book update arrives.
+
+        Args:
+            timeout (float): Maximum time to wait in seconds.
+
+        Returns:
+            bool: True if order book data is available, False on timeout.
         """
-        return self.orderbook_data
+        try:
+            async with asyncio.timeout(timeout):
+                # Shielded, a timeout must not cancel the future publish_orderbook resolves
+                await asyncio.shield(self._first_book)
+        except TimeoutError:
+            return False
+        return True
 
     def calculate_target_price(self, entry_price: float) -> float:
         """Calculates the target price based on the target profit percentage.
@@ -101,7 +464,7 @@ class TradingBot:
         Returns:
             float: Target price to achieve the desired profit.
         """
-        return entry_price * (1 + TARGET_PROFIT_PERCENT / 100)
+        return entry_price * TARGET_PROFIT_MULT
 
     async def open_position(self) -> bool:
         """Opens a new trading position on Bybit.
@@ -110,77 +473,92 @@ class TradingBot:
             bool: True if position opened successfully, False otherwise.
         """
         try:
-            await self.subscribe_to_orderbook()
-            await asyncio.sleep(1)
-
-            # Get the current order book data
-            orderbook = self.orderbook_data
-            if not orderbook.get('bid') or not orderbook.get('ask'):
+            # The stream is opened at startup, the book is only valid while it is connected
+            if not self.is_subscribed or not self._first_book.done():
                 logger.error("Cannot open position: no orderbook data")
                 return False
 
-            # Clear the event before placing the order
-            self.order_response_event.clear()
+            # Get the current ask, the buffer keeps changing while the order is in flight
+            ask_price = float(self._book[1])
 
             # Place the order
-            self.ws_private.place_order(
-                callback=self.handle_order_response,
-                category="spot",
-                symbol=SYMBOL,
-                side="Buy",
-                orderType="MARKET",
-                qty=str(AMOUNT),
-                marketUnit="baseCoin"
-            )
+            response = self._place_order(self._buy_order)
 
-            # Wait for order response (max 10 seconds)
+            # Wait for order response (max 2 seconds)
             try:
-                await asyncio.wait_for(self.order_response_event.wait(), timeout=2.0)
-            except asyncio.TimeoutError:
+                async with asyncio.timeout(2.0):
+                    order_response = await response
+            except TimeoutError:
                 logger.error("Timeout waiting for order response")
                 return False
 
-            if self.order_response and self.order_response.get('retCode') == 0:
-                entry_price = orderbook['ask']
+            if order_response.get('retCode') == 0:
+                entry_price = ask_price
+                self._target_hit = self._loop.create_future()
                 self.active_position = {
-                    'order_id': self.order_response['data']['orderId'],
+                    'order_id': order_response['data']['orderId'],
                     'symbol': SYMBOL,
                     'amount': AMOUNT,
                     'entry_price': entry_price,
                     'target_price': self.calculate_target_price(entry_price),
                 }
-                logger.info(f"Opened new position: {self.active_position}")
-                asyncio.create_task(self.monitor_position())
+                logger.info("Opened new position: %s", self.active_position)
+                self._monitor_task = self._task_group.create_task(self.monitor_position())
                 return True
 
-            logger.error(f"Error opening position: {self.order_response}")
+            logger.error("Error opening position: %s", order_response)
             return False
 
         except Exception as e:
-            logger.error(f"Error in open_position: {e}")
+            logger.error("Error in open_position: %s", e)
             return False
 
     async def monitor_position(self) -> None:
-        """Monitors the open position to close it upon reaching the target profit."""
+        """Monitors the open position to close it upon reaching the target profit.
+
+        Sleeps until publish_orderbook resolves the target future instead of polling the order book.
+        """
         while self.active_position:
             try:
-                order_book = await self.get_order_book()
-                if not order_book or not order_book.get('bid'):
-                    logger.warning("No orderbook data available for monitoring")
-                    await asyncio.sleep(1)
-                    continue
-
-                current_price = order_book['bid']
+                exit_bid = await self._target_hit
+                logger.info("Target price reached, bid: %s", exit_bid)
 
-                if current_price >= self.active_position['target_price']:
-                    await self.close_position()
-
-                await asyncio.sleep(0.1)
+                # The close runs in its own task outside the group, once the sell order is sent
+                # it is seen through even if this monitor gets cancelled, stop waits for it
+                self._close_task = self._loop.create_task(self.close_position())
+                if not await asyncio.shield(self._close_task):
+                    # Re-arm, the next tick at or above the target price retries the close
+                    self._target_hit = self._loop.create_future()
 
             except Exception as e:
-                logger.error(f"Error in monitor_position: {e}")
+                logger.error("Error in monitor_position: %s", e)
                 await asyncio.sleep(1)
 
+    async def stop(self) -> None:
+        """Closes the order book stream and stops the trading bot's background tasks on shutdown.
+
+        A sell order already in flight is awaited first, so shutdown never leaves the position
+        open with its close abandoned halfway, and the close still reads the live exit price.
+        """
+        self._stopping = True
+        close_task = self._close_task
+        if close_task and not close_task.done():
+            logger.info("Waiting for the position to close...")
+            try:
+                async with asyncio.timeout(POSITION_CLOSE_DRAIN_TIMEOUT):
+                    await asyncio.shield(close_task)
+            except TimeoutError:
+                logger.error("Timeout waiting for in-flight close position")
+
+        ws_public = self.ws_public
+        if ws_public:
+            ws_public.disconnect()
+            await ws_public.wait_disconnected()
+
+        for task in (self._monitor_task, self._resubscribe_task):
+            if task:
+                task.cancel()
+
     async def close_position(self) -> bool:
         """Closes the open position.
 
@@ -188,63 +566,100 @@ class TradingBot:
             bool: True if position closed successfully, False otherwise.
         """
         try:
-            self.order_response_event.clear()
-
-            self.ws_private.place_order(
-                callback=self.handle_order_response,
-                category="spot",
-                symbol=SYMBOL,
-                side="Sell",
-                orderType="MARKET",
-                qty=str(AMOUNT),
-                marketUnit="baseCoin"
-            )
+            response = self._place_order(self._sell_order)
 
             try:
-                await asyncio.wait_for(self.order_response_event.wait(), timeout=10.0)
-            except asyncio.TimeoutError:
+                async with asyncio.timeout(10.0):
+                    order_response = await response
+            except TimeoutError:
                 logger.error("Timeout waiting for close position response")
                 return False
 
-            if self.order_response and self.order_response.get('retCode') == 0:
+            if order_response.get('retCode') == 0:
+                # Snapshot the position before clearing it, the notification is built from locals
+                position = self.active_position
+                bid_price = float(self._book[0])
                 self.active_position = None
-                logger.info(f"Position closed successfully: {self.order_response}")
+                logger.info("Position closed successfully: %s", order_response)
 
-                bid_price = self.orderbook_data['bid']
-                profit_percentage = ((bid_price / self.active_position['entry_price']) - 1) * 100
+                entry_price = position['entry_price']
+                profit_percentage = ((bid_price / entry_price) - 1) * 100
                 await send_notification(f"✅ Position closed!\n"
-                                        f"Trading Pair: {self.active_position['symbol']}\n"
+                                        f"Trading Pair: {position['symbol']}\n"
                                         f"Profit Percentage: {profit_percentage:.2f}%\n"
-                                        f"Entry Price: {self.active_position['entry_price']}\n"
-                                        f"Target Price: {self.active_position['target_price']}\n"
+                                        f"Entry Price: {entry_price}\n"
+                                        f"Target Price: {position['target_price']}\n"
                                         f"Exit Price: {bid_price}")
                 return True
 
-            logger.error(f"Error closing position: {self.order_response}")
+            logger.error("Error closing position: %s", order_response)
             return False
 
         except Exception as e:
-            logger.error(f"Error in close_position: {e}")
+            logger.error("Error in close_position: %s", e)
             return False
 
 
 # Initialize the trading bot
-trading_bot = TradingBot(ws_private, ws_public)
+trading_bot = TradingBot(ws_private)
 
 
 async def send_notification(message: str) -> None:
     """Sends a notification to Telegram.
 
-    Sends the specified message to the Telegram chat using the bot.
+    Queues the specified message, notification_flusher delivers it to the Telegram chat,
+    so the caller never waits on the Telegram API.
 
     Args:
         message (str): The message to send.
     """
-    try:
-        await bot.send_message(chat_id=TELEGRAM_CHAT_ID, text=message)
-        logger.info(f"Sent notification to Telegram: {message}")
-    except Exception as e:
-        logger.error(f"Error while sending notification to Telegram: {e}")
+    await notification_queue.put(message)
+
+
+def batch_notifications(messages: list[str]) -> list[str]:
+    """Joins notifications into as few Telegram messages as the length limit allows.
+
+    Args:
+        messages (list[str]): Notifications in the order they were queued.
+
+    Returns:
+        list[str]: Texts to send, each one within TELEGRAM_MESSAGE_LIMIT unless a single
+        notification is already longer.
+    """
+    batches = []
+    current = ""
+    for message in messages:
+        if current and len(current) + len(NOTIFICATION_SEPARATOR) + len(message) > TELEGRAM_MESSAGE_LIMIT:
+            batches.append(current)
+            current = message
+        else:
+            current = f"{current}{NOTIFICATION_SEPARATOR}{message}" if current else message
+    if current:
+        batches.append(current)
+    return batches
+
+
+async def notification_flusher() -> None:
+    """Sends queued notifications to Telegram.
+
+    Waits for the first message, then collects everything queued during NOTIFICATION_FLUSH_INTERVAL
+    and sends it in as few requests as possible to stay clear of Telegram rate limits.
+    """
+    while True:
+        messages = [await notification_queue.get()]
+        await asyncio.sleep(NOTIFICATION_FLUSH_INTERVAL)
+        while not notification_queue.empty():
+            messages.append(notification_queue.get_nowait())
+
+        for text in batch_notifications(messages):
+            try:
+                await bot.send_message(chat_id=TELEGRAM_CHAT_ID, text=text)
+                logger.info("Sent notification to Telegram: %s", text)
+            except Exception as e:
+                logger.error("Error while sending notification to Telegram: %s", e)
+
+        for _ in messages:
+            notification_queue.task_done()
 
 
 # Telegram command handlers
@@ -265,11 +680,11 @@ async def status_command(message: types.Message):
     try:
         if trading_bot.active_position:
             order_book = await trading_bot.get_order_book()
-            if not order_book or not order_book.get('bid'):
+            current_price = float(order_book[0])
+            if not current_price:
                 await message.answer("❌ Cannot get current price")
                 return
 
-            current_price = order_book['bid']
             current_profit = ((current_price / trading_bot.active_position['entry_price']) - 1) * 100
 
             await message.answer(
@@ -284,7 +699,7 @@ async def status_command(message: types.Message):
             await message.answer("⚠️ No open position")
 
     except Exception as e:
-        logger.error(f"Error in status_command: {e}")
+        logger.error("Error in status_command: %s", e)
         await message.answer("❌ An error occurred while checking the position status")
 
 
@@ -309,7 +724,7 @@ async def trade_command(message: types.Message):
             await message.answer("❌ Could not open the position")
 
     except Exception as e:
-        logger.error(f"Error in trade_command: {e}")
+        logger.error("Error in trade_command: %s", e)
         await message.answer("❌ An error occurred while opening a position")
 
 
@@ -322,37 +737,59 @@ async def main():
     updates and ensures any open connections and asynchronous tasks are
     properly closed or canceled on exit.
 
-    - On startup: Sends a notification about the successful start of the bot.
-    - On shutdown: Stops polling, closes the bot session, cancels pending
-      tasks, and sends a notification about the shutdown.
+    - On startup: Starts the notification flusher in the bot's task group and
+      sends a notification about the successful start of the bot.
+    - On shutdown: Stops polling, waits for a position close in flight, stops
+      the trading bot's tasks, sends a notification about the shutdown, waits
+      for queued notifications to be delivered, closes the bot session and
+      cancels the notification flusher.
 
     Exception handling ensures that any errors during the bot's execution
     are logged appropriately.
     """
 
-    try:
+    # Callbacks blocking the loop longer than this are reported in asyncio debug mode (PYTHONASYNCIODEBUG=1)
+    asyncio.get_running_loop().slow_callback_duration = 0.05
+
+    # Background tasks (notification flusher, position monitors, order book reconnects) belong to this group
+    async with asyncio.TaskGroup() as task_group:
         logger.info("Starting bot...")
-        await send_notification("🚀The bot started successfully.")
-        await dp.start_polling(bot)
-    except Exception as e:
-        logger.exception(f"Error in main: {str(e)}")
-    finally:
-        logger.info("Shutting down bot...")
-        await send_notification("⚠️ The bot has shutdown.")
+        flusher = task_group.create_task(notification_flusher())
+        try:
+            await trading_bot.start(task_group)
 
-        await bot.session.close()
+            # Move everything created at startup out of the collector's reach and make gen0 collections rare,
+            # so GC pauses do not land on order book ticks. Trade state kept for the bot's lifetime must not
+            # form reference cycles, cycles are only reclaimed by these rare collections.
+            gc.collect()
+            gc.freeze()
+            gc.set_threshold(50_000, 20, 20)
 
-        # Cancel all tasks
-        pending = asyncio.all_tasks()
-        for task in pending:
-            if task is not asyncio.current_task():
-                task.cancel()
+            await send_notification("🚀The bot started successfully.")
+            await dp.start_polling(bot)
+        except Exception as e:
+            logger.exception("Error in main: %s", e)
+        finally:
+            logger.info("Shutting down bot...")
+            await trading_bot.stop()
+            await send_notification("⚠️ The bot has shutdown.")
+            try:
+                async with asyncio.timeout(NOTIFICATION_DRAIN_TIMEOUT):
+                    await notification_queue.join()
+            except TimeoutError:
+                logger.error("Timeout waiting for queued notifications to be sent")
 
-        # Wait for tasks to be cancelled or finished
-        await asyncio.gather(*pending, return_exceptions=True)
+            await bot.session.close()
 
-        logger.info("The bot has shutdown succesfully.")
+            # The bot's tasks are already stopped, leaving the group waits for the cancelled flusher
+            flusher.cancel()
 
+    logger.info("The bot has shutdown succesfully.")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if sys.platform != "win32":
+        import uvloop
+
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
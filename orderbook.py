@@ -0,0 +1,100 @@
+import numpy as np
+from fastnumbers import RAISE, try_array
+
+
+class OrderBookSide:
+    __slots__ = ("depth", "count", "_sign", "_keys", "_sizes")
+
+    def __init__(self, depth: int, descending: bool):
+        """Initializes one side of the local order book.
+
+        Levels are kept best price first in preallocated buffers. Bid prices are stored negated,
+        so both sides are sorted ascending and can be searched with np.searchsorted.
+
+        Args:
+            depth (int): Number of price levels to keep.
+            descending (bool): True for bids, where the best price is the highest one.
+        """
+        self.depth = depth
+        self.count = 0
+        self._sign = -1.0 if descending else 1.0
+        # One spare slot lets an insert shift the worst level out before the count is trimmed
+        self._keys = np.zeros(depth + 1, dtype=np.float64)
+        self._sizes = np.zeros(depth + 1, dtype=np.float64)
+
+    def clear(self) -> None:
+        """Drops all levels, the next snapshot rebuilds the side."""
+        self.count = 0
+
+    @property
+    def best(self) -> float:
+        """Best price of this side, 0.0 while the side is empty."""
+        return self._sign * self._keys[0] if self.count else 0.0
+
+    @property
+    def prices(self) -> np.ndarray:
+        """Prices of all levels, best first."""
+        return self._sign * self._keys[:self.count]
+
+    @property
+    def sizes(self) -> np.ndarray:
+        """Sizes of all levels, best first."""
+        return self._sizes[:self.count]
+
+    def load(self, levels: list[list[str]]) -> None:
+        """Replaces this side with a snapshot.
+
+        Args:
+            levels (list[list[str]]): [price, size] pairs, best first.
+        """
+        # Parsing writes into the live buffers, a snapshot that fails halfway leaves the side empty
+        self.count = 0
+        count = min(len(levels), self.depth)
+        levels = levels[:count]
+        keys = self._keys[:count]
+        # fastnumbers parses the decimal strings straight into the preallocated buffers
+        try_array([level[0] for level in levels], keys, on_fail=RAISE)
+        keys *= self._sign
+        try_array([level[1] for level in levels], self._sizes[:count], on_fail=RAISE)
+        self.count = count
+
+    def apply(self, levels: list[list[str]]) -> None:
+        """Applies a delta, touching only the changed levels.
+
+        Removals are applied before inserts, whatever order the delta lists them in. An insert into
+        a full side pushes out the worst level, which must only happen once the removals have freed
+        the room the server's book has.
+
+        Args:
+            levels (list[list[str]]): [price, size] pairs, a size of 0 removes the level.
+        """
+        keys = self._keys
+        sizes = self._sizes
+        sign = self._sign
+        depth = self.depth
+        count = self.count
+        # Parsed before the buffers are touched, a malformed level leaves the side as it was
+        updates = [(sign * float(price), float(size)) for price, size in levels]
+
+        for key, size in updates:
+            if size:
+                continue
+            index = int(np.searchsorted(keys[:count], key))
+            if index < count and keys[index] == key:
+                keys[index:count - 1] = keys[index + 1:count]
+                sizes[index:count - 1] = sizes[index + 1:count]
+                count -= 1
+
+        for key, size in updates:
+            if not size:
+                continue
+            index = int(np.searchsorted(keys[:count], key))
+            if index < count and keys[index] == key:
+                sizes[index] = size
+            elif index < depth:
+                keys[index + 1:count + 1] = keys[index:count]
+                sizes[index + 1:count + 1] = sizes[index:count]
+                keys[index] = key
+                sizes[index] = size
+                count = min(count + 1, depth)
+        self.count = count
@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from orderbook import OrderBookSide
+
+
+def levels(pairs):
+    return [[str(price), str(size)] for price, size in pairs]
+
+
+def test_load_keeps_best_first():
+    bids = OrderBookSide(3, descending=True)
+    bids.load(levels([(100, 1), (99, 2), (98, 3), (97, 4)]))
+    assert bids.prices.tolist() == [100, 99, 98]
+    assert bids.sizes.tolist() == [1, 2, 3]
+    assert bids.best == 100
+
+    asks = OrderBookSide(3, descending=False)
+    asks.load(levels([(101, 1), (102, 2)]))
+    assert asks.prices.tolist() == [101, 102]
+    assert asks.best == 101
+
+
+def test_apply_updates_inserts_and_removes():
+    bids = OrderBookSide(5, descending=True)
+    bids.load(levels([(100, 1), (99, 1), (97, 1)]))
+    bids.apply(levels([(99, 5), (98, 2), (100, 0), (101, 3)]))
+    assert bids.prices.tolist() == [101, 99, 98, 97]
+    assert bids.sizes.tolist() == [3, 5, 2, 1]
+
+
+def test_apply_removes_before_inserting_into_full_side():
+    asks = OrderBookSide(5, descending=False)
+    asks.load(levels([(101, 1), (102, 1), (109, 1), (113, 1), (114, 1)]))
+    asks.apply(levels([(111, 3), (113, 0)]))
+    assert asks.prices.tolist() == [101, 102, 109, 111, 114]
+    assert asks.sizes.tolist() == [1, 1, 1, 3, 1]
+
+
+def test_apply_matches_server_top_of_book():
+    depth = 5
+    rng = random.Random(0)
+    for _ in range(200):
+        server = {float(price): 1.0 for price in rng.sample(range(100, 130), 15)}
+        sent = {price: server[price] for price in sorted(server)[:depth]}
+        side = OrderBookSide(depth, descending=False)
+        side.load(levels(sent.items()))
+
+        for _ in range(30):
+            for price in rng.sample(range(100, 130), 3):
+                if price in server and rng.random() < 0.5:
+                    del server[price]
+                else:
+                    server[float(price)] = float(rng.randint(1, 9))
+            # Bybit only sends the levels of its top of book that changed, best first
+            top = {price: server[price] for price in sorted(server)[:depth]}
+            delta = [(price, 0) for price in sent if price not in top]
+            delta += [(price, size) for price, size in top.items() if sent.get(price) != size]
+            side.apply(levels(sorted(delta)))
+            sent = top
+
+            assert side.prices.tolist() == list(top)
+            assert side.sizes.tolist() == list(top.values())
+
+
+def test_apply_malformed_delta_leaves_side_unchanged():
+    bids = OrderBookSide(5, descending=True)
+    bids.load(levels([(100, 1), (99, 1), (98, 1)]))
+    with pytest.raises(ValueError):
+        bids.apply([["100", "0"], ["97", "oops"]])
+    assert bids.prices.tolist() == [100, 99, 98]
+
+    bids.apply(levels([(95, 1)]))
+    assert bids.prices.tolist() == [100, 99, 98, 95]